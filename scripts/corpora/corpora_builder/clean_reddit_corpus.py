@@ -10,6 +10,7 @@ Apply character filtering and line merging:
 
 import re
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import typer
 from typing_extensions import Annotated
@@ -17,13 +18,34 @@ from typing_extensions import Annotated
 from .corpus_cleaner import (
     DEFAULT_CHUNK_SIZE,
     DEFAULT_MERGE_LINES_RATIO,
+    IO_BUFFER_SIZE,
     REDDIT_ALLOWED_CHARS,
     BASE_REPLACEMENTS,
-    process_chunk,
-    merge_lines,
+    TranslateTable,
+    build_translate_table,
+    merge_lines_stream,
+    process_file,
+    read_text_chunks,
     temp_file_cleanup,
 )
 
+MULTI_SPACE_RE = re.compile(r" +")
+
+
+def collapse_spaces_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """Collapse runs of spaces into one, including runs spanning chunk boundaries."""
+    previous_ends_with_space = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        chunk = MULTI_SPACE_RE.sub(" ", chunk)
+        if previous_ends_with_space:
+            chunk = chunk.removeprefix(" ")
+        if chunk:
+            previous_ends_with_space = chunk.endswith(" ")
+            yield chunk
+
+
 app = typer.Typer(help="Clean Reddit corpus for English keyboard layout optimization")
 
 
@@ -46,40 +68,33 @@ def main(
     Applies character filtering and line merging to prepare text for
     generating n-gram frequency tables for keyboard layout analysis.
     """
-    allowed_chars: set[str] = REDDIT_ALLOWED_CHARS
-    replacements: dict[str, str] = BASE_REPLACEMENTS
+    table: TranslateTable = build_translate_table(
+        BASE_REPLACEMENTS, REDDIT_ALLOWED_CHARS
+    )
     chunk_size: int = DEFAULT_CHUNK_SIZE
     merge_lines_ratio: float = DEFAULT_MERGE_LINES_RATIO
 
     intermediate_file = outfile.with_suffix(outfile.suffix + ".intermediate")
+    merging_file = outfile.with_suffix(outfile.suffix + ".merging")
 
-    with temp_file_cleanup(intermediate_file):
+    with temp_file_cleanup(intermediate_file), temp_file_cleanup(merging_file):
         typer.echo("Step 1: Applying character replacements and filtering...")
-        with (
-            infile.open("r", encoding="utf-8") as infile_handle,
-            intermediate_file.open("w", encoding="utf-8") as outfile_handle,
-        ):
-            while True:
-                chunk = infile_handle.read(chunk_size)
-                if not chunk:
-                    break
-                chunk = chunk.lower()
-                processed = process_chunk(chunk, replacements, allowed_chars)
-                outfile_handle.write(processed)
+        process_file(infile, intermediate_file, table, chunk_size, lowercase=True)
 
+        # Steps 2-4 are streamed chunk by chunk in a single pass
         typer.echo(
             f"Step 2: Merging lines ({int(merge_lines_ratio * 100)}% newlines kept)..."
         )
-        text = intermediate_file.read_text(encoding="utf-8")
-        text = merge_lines(text, merge_lines_ratio)
-
         typer.echo("Step 3: Removing remaining newlines...")
-        text = text.replace("\n", "")
-
         typer.echo("Step 4: Removing double spaces...")
-        text = re.sub(r" +", " ", text)
-
-        outfile.write_text(text, encoding="utf-8")
+        chunks = read_text_chunks(intermediate_file, chunk_size)
+        chunks = merge_lines_stream(chunks, merge_lines_ratio)
+        chunks = (chunk.replace("\n", "") for chunk in chunks)
+        # Stream into a temp file so outfile only appears once complete
+        with merging_file.open("wb", buffering=IO_BUFFER_SIZE) as outfile_handle:
+            for chunk in collapse_spaces_stream(chunks):
+                outfile_handle.write(chunk.encode("utf-8"))
+        merging_file.rename(outfile)
 
     typer.echo(f"✓ Cleaned corpus written to {outfile}")
 
@@ -14,12 +14,16 @@ Philosophy:
 - Delete symbols rare in natural text rather than converting to multi-char
 """
 
+import codecs
+import io
+import os
 import re
-import itertools
 import subprocess
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import Iterable, Iterator, Literal, get_args
 
 import typer
 from typing_extensions import Annotated
@@ -28,8 +32,16 @@ Language = Literal["english", "french"]
 
 # Processing constants
 DEFAULT_CHUNK_SIZE = 50 * 1024 * 1024  # 50MB
+IO_BUFFER_SIZE = 16 * 1024 * 1024  # 16MB
 DEFAULT_MERGE_LINES_RATIO = 0.2  # Keep 1 in 5 newlines
 
+# process_chunk splits a chunk into ASCII and non-ASCII runs when a sample
+# shows at most one non-ASCII run per MIN_CHARS_PER_NON_ASCII_RUN characters
+NON_ASCII_RUN_RE = re.compile(r"[^\x00-\x7f]+")
+NON_ASCII_SPLIT_RE = re.compile(r"([^\x00-\x7f]+)")
+NON_ASCII_SAMPLE_SIZE = 64 * 1024
+MIN_CHARS_PER_NON_ASCII_RUN = 256
+
 # Base typable characters (standard US keyboard)
 TYPABLE_CHARS = "qwertyuiopasdfghjklzxcvbnmQWERTYUIOPASDFGHJKLZXCVBNM1234567890üöä"
 TYPABLE_CHARS += r""",.!?;:_'"{}^~%&/\()[]<>=+-*`@$€|"""
@@ -42,11 +54,8 @@ FRENCH_CHARS = "àâäæçéèêëïîôùûüÿœÀÂÄÆÇÉÈÊËÏÎÔÙÛÜ
 # Philosophy: Normalize to ASCII equivalents without inflating character counts
 BASE_REPLACEMENTS = {
     # Normalize quotes
-    "'": "'",
     "´": "'",
     "`": "'",
-    """: '"',
-    """: '"',
     "«": '"',
     "»": '"',
     # Normalize dashes to single hyphen
@@ -208,28 +217,190 @@ def apply_replacements(text: str, replacements: dict[str, str]) -> str:
 
 def filter_characters(text: str, allowed_chars: set[str]) -> str:
     """Keep only allowed characters."""
-    return "".join(char for char in text if char in allowed_chars)
+    # Only the characters actually present in the text need a table entry,
+    # so str.translate can delete them in a single C-level pass
+    disallowed = set(text).difference(allowed_chars)
+    return text.translate(dict.fromkeys(map(ord, disallowed)))
+
+
+class TranslateTable(dict):
+    """str.translate table that applies replacements and filters in one pass.
+
+    Replacement characters are mapped up front. Any other codepoint is
+    resolved on first lookup (kept if allowed, deleted otherwise) and
+    memoized, so the table only grows with the characters actually seen.
+    """
+
+    def __init__(self, replacements: dict[str, str], allowed_chars: set[str]):
+        super().__init__(
+            # Replacement output is filtered too, as if replaced then filtered
+            (ord(old_char), filter_characters(new_char, allowed_chars) or None)
+            for old_char, new_char in replacements.items()
+        )
+        self.allowed_chars = frozenset(allowed_chars)
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = codepoint if chr(codepoint) in self.allowed_chars else None
+        self[codepoint] = value
+        return value
+
+
+def build_translate_table(
+    replacements: dict[str, str], allowed_chars: set[str]
+) -> TranslateTable:
+    """Build a translate table fusing apply_replacements and filter_characters."""
+    return TranslateTable(replacements, allowed_chars)
+
+
+# Translate tables per language, built once at import
+_LANGUAGE_TABLES: dict[Language, TranslateTable] = {
+    language: build_translate_table(
+        get_replacements(language), get_allowed_characters(language)
+    )
+    for language in get_args(Language)
+}
+
+
+def get_translate_table(language: Language = "english") -> TranslateTable:
+    """Get the precomputed translate table for a given language."""
+    return _LANGUAGE_TABLES[language]
+
+
+def _has_sparse_non_ascii(chunk: str) -> bool:
+    """Estimate from a prefix sample whether non-ASCII runs are rare in chunk."""
+    sample = chunk[:NON_ASCII_SAMPLE_SIZE]
+    runs = len(NON_ASCII_RUN_RE.findall(sample))
+    return runs * MIN_CHARS_PER_NON_ASCII_RUN <= len(sample)
 
 
-def process_chunk(
-    chunk: str, replacements: dict[str, str], allowed_chars: set[str]
-) -> str:
+def process_chunk(chunk: str, table: TranslateTable) -> str:
     """Process a chunk of text: apply replacements and filter characters."""
-    chunk = apply_replacements(chunk, replacements)
-    chunk = filter_characters(chunk, allowed_chars)
-    return chunk
+    # str.translate has a fast path for pure-ASCII strings only, and leaves
+    # it for good at the first non-ASCII character. When those are rare,
+    # translating the ASCII and non-ASCII runs separately keeps most of the
+    # text on the fast path.
+    if chunk.isascii() or not _has_sparse_non_ascii(chunk):
+        return chunk.translate(table)
+    return "".join([run.translate(table) for run in NON_ASCII_SPLIT_RE.split(chunk)])
+
+
+def _join_line_groups(lines: list[str], keep_every_n: int, first_group: int) -> str:
+    """Join lines with spaces in groups of keep_every_n, separating groups by newlines.
+
+    The first group holds first_group lines, so a stream can resume mid-cycle.
+    """
+    groups = [" ".join(lines[:first_group])]
+    groups.extend(
+        " ".join(lines[i : i + keep_every_n])
+        for i in range(first_group, len(lines), keep_every_n)
+    )
+    return "\n".join(groups)
 
 
 def merge_lines(text: str, keep_ratio: float = 0.2) -> str:
     """Merge lines by replacing some newlines with spaces."""
     keep_every_n = int(1 / keep_ratio)
-    return re.sub(
-        "(\n)",
-        lambda m, c=itertools.count(): m.group()
-        if next(c) % keep_every_n == (keep_every_n - 1)
-        else " ",
-        text,
+    return _join_line_groups(text.split("\n"), keep_every_n, keep_every_n)
+
+
+def merge_lines_stream(chunks: Iterable[str], keep_ratio: float = 0.2) -> Iterator[str]:
+    """Merge lines across a stream of text chunks, like merge_lines.
+
+    The newline counter is carried across chunk boundaries, so the output
+    matches merge_lines on the concatenated text without loading it whole.
+    """
+    keep_every_n = int(1 / keep_ratio)
+    newline_count = 0
+    for chunk in chunks:
+        lines = chunk.split("\n")
+        first_group = keep_every_n - newline_count % keep_every_n
+        yield _join_line_groups(lines, keep_every_n, first_group)
+        newline_count += len(lines) - 1
+
+
+def read_text_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Read a UTF-8 file in binary chunks of chunk_size bytes and yield decoded text.
+
+    Multi-byte characters and CRLF pairs split across chunk boundaries are
+    carried over to the next chunk, matching text-mode reads.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(), translate=True
     )
+    with open(path, "rb", buffering=IO_BUFFER_SIZE) as f:
+        while raw := f.read(chunk_size):
+            if text := decoder.decode(raw):
+                yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+def _clean_chunk(chunk: str, table: TranslateTable, lowercase: bool) -> bytes:
+    if lowercase:
+        chunk = chunk.lower()
+    return process_chunk(chunk, table).encode("utf-8")
+
+
+# Per-worker state for process_file, set once by the pool initializer
+_worker_table: TranslateTable | None = None
+_worker_lowercase = False
+
+
+def _init_worker(table: TranslateTable, lowercase: bool) -> None:
+    global _worker_table, _worker_lowercase
+    _worker_table, _worker_lowercase = table, lowercase
+
+
+def _process_chunk_in_worker(chunk: str) -> bytes:
+    return _clean_chunk(chunk, _worker_table, _worker_lowercase)
+
+
+def process_file(
+    input_path: Path,
+    output_path: Path,
+    table: TranslateTable,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    lowercase: bool = False,
+    max_workers: int | None = None,
+) -> None:
+    """Run process_chunk over a file, writing chunks in order.
+
+    With a single worker the chunks are processed in-process. Otherwise the
+    file is dispatched to a process pool in sub-chunks of chunk_size divided
+    by the worker count, with at most max_workers + 1 sub-chunks in flight,
+    so peak memory stays within a small multiple of chunk_size whatever the
+    worker count.
+
+    Args:
+        input_path: Path to input text file
+        output_path: Path to output file
+        table: Translate table passed to process_chunk
+        chunk_size: Size of chunks to process in bytes (default 50MB)
+        lowercase: If True, lowercase each chunk before processing
+        max_workers: Number of worker processes (default: CPU count)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers == 1:
+        with output_path.open("wb", buffering=IO_BUFFER_SIZE) as outfile:
+            for chunk in read_text_chunks(input_path, chunk_size):
+                outfile.write(_clean_chunk(chunk, table, lowercase))
+        return
+
+    sub_chunk_size = max(1, chunk_size // max_workers)
+    with (
+        ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(table, lowercase)
+        ) as executor,
+        output_path.open("wb", buffering=IO_BUFFER_SIZE) as outfile,
+    ):
+        pending: deque[Future[bytes]] = deque()
+        for chunk in read_text_chunks(input_path, sub_chunk_size):
+            if len(pending) > max_workers:
+                outfile.write(pending.popleft().result())
+            pending.append(executor.submit(_process_chunk_in_worker, chunk))
+        while pending:
+            outfile.write(pending.popleft().result())
 
 
 @contextmanager
@@ -258,17 +429,21 @@ def clean_corpus(
         language: "english" or "french"
         remove_line_numbers: If True, remove leading line numbers (Leipzig format)
         merge_lines_ratio: Ratio of newlines to keep (0.2 = 1 out of 5)
-        chunk_size: Size of chunks to process (default 50MB)
+        chunk_size: Size of chunks to process in bytes (default 50MB)
     """
     input_path = Path(input_path)
     output_path = Path(output_path)
 
-    allowed_chars = get_allowed_characters(language)
-    replacements = get_replacements(language)
+    table = get_translate_table(language)
     temp_file = output_path.with_suffix(output_path.suffix + ".tmp")
     intermediate_file = output_path.with_suffix(output_path.suffix + ".intermediate")
+    merging_file = output_path.with_suffix(output_path.suffix + ".merging")
 
-    with temp_file_cleanup(temp_file), temp_file_cleanup(intermediate_file):
+    with (
+        temp_file_cleanup(temp_file),
+        temp_file_cleanup(intermediate_file),
+        temp_file_cleanup(merging_file),
+    ):
         if remove_line_numbers:
             typer.echo("Step 1: Removing line numbers...")
             with temp_file.open("w") as f:
@@ -286,24 +461,18 @@ def clean_corpus(
         typer.echo(
             f"Step {1 + step_offset}: Applying character replacements and filtering..."
         )
-        with (
-            process_input.open("r", encoding="utf-8") as infile,
-            intermediate_file.open("w", encoding="utf-8") as outfile,
-        ):
-            while True:
-                chunk = infile.read(chunk_size)
-                if not chunk:
-                    break
-                processed = process_chunk(chunk, replacements, allowed_chars)
-                outfile.write(processed)
+        process_file(process_input, intermediate_file, table, chunk_size)
 
         if merge_lines_ratio > 0:
             typer.echo(
                 f"Step {2 + step_offset}: Merging lines ({int(merge_lines_ratio * 100)}% newlines kept)..."
             )
-            text = intermediate_file.read_text(encoding="utf-8")
-            text = merge_lines(text, merge_lines_ratio)
-            output_path.write_text(text, encoding="utf-8")
+            # Stream into a temp file so output_path only appears once complete
+            with merging_file.open("wb", buffering=IO_BUFFER_SIZE) as outfile:
+                chunks = read_text_chunks(intermediate_file, chunk_size)
+                for merged in merge_lines_stream(chunks, merge_lines_ratio):
+                    outfile.write(merged.encode("utf-8"))
+            merging_file.rename(output_path)
         else:
             intermediate_file.rename(output_path)
 
@@ -7,6 +7,10 @@ import typer
 from typing_extensions import Annotated
 from convokit import Corpus, download
 
+from .corpus_cleaner import IO_BUFFER_SIZE
+
+WRITE_BATCH_SIZE = 8192  # Strings (text + newline) buffered per writelines call
+
 app = typer.Typer(help="Extract text from ConvoKit Reddit corpus")
 
 
@@ -17,12 +21,17 @@ def extract_reddit_corpus(output_file: Path) -> None:
 
     typer.echo(f"Processing {len(corpus.utterances)} utterances...")
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    with open(output_file, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+        batch: list[str] = []
         for utterance in corpus.iter_utterances():
             text = utterance.text
             if text and text.strip():
-                cleaned_text = " ".join(text.split())
-                f.write(cleaned_text + "\n")
+                batch.append(" ".join(text.split()))
+                batch.append("\n")
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    f.writelines(batch)
+                    batch.clear()
+        f.writelines(batch)
 
     typer.echo(f"✓ Extracted text to {output_file}")
 
@@ -1,27 +1,49 @@
 #!/usr/bin/env python3
 
 import csv
+import io
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, TextIO
+from typing import Callable, Iterable, Iterator, TextIO
 from urllib.parse import quote
 import unicodedata
 
 import typer
 from rich.console import Console
 
+try:
+    import orjson  # optional, faster parsing of large result files
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
 # Frequency and formatting
 DEFAULT_FREQ_THRESHOLD = 0.01  # 1% - minimum frequency to include in reports
+# Frequencies are printed without leading zeros, so against this "0.xx" form a
+# plain string comparison orders them the same as their float values
+DEFAULT_FREQ_THRESHOLD_TEXT = f"{DEFAULT_FREQ_THRESHOLD}"
 BALANCE_METRIC_DECIMALS = 1  # decimal places for balance metrics
 DEFAULT_METRIC_DECIMALS = 2  # decimal places for most metrics
 
+READ_BUFFER_SIZE = 64 * 1024  # 64KB - buffer for line-by-line text reads
+
+# Below this many layouts, process pool startup costs more than it saves
+PARALLEL_LAYOUTS_THRESHOLD = 2000
+PARALLEL_SVGS_THRESHOLD = 50
+
 # Metrics that should have low-frequency entries filtered
-METRICS_TO_FILTER = ["SFB", "Manual Bigram Penalty", "Scissors", "FSB", "HSB"]
+METRICS_TO_FILTER = frozenset(
+    {"SFB", "Manual Bigram Penalty", "Scissors", "FSB", "HSB"}
+)
 
 BIGRAM_STAT_PATTERNS = ["SFB", "Vertical", "Squeeze", "Splay", "Diagonal", "Lateral"]
 
@@ -40,15 +62,71 @@ SCISSOR_PATTERNS = ["Vertical", "Squeeze", "Splay", "Diagonal", "Lateral"]
 
 ROLL_PATTERNS = ["2-Roll Total", "2-Roll In", "2-Roll Out", "2-Roll Center→South"]
 
-SECTION_RE = re.compile(r"^\s*([^:;]+):\s*(.*)$")
-ENTRY_RE = re.compile(
-    r"(?:(?<=^)|(?<=,)|(?<=;)|(?<=:))\s*"  # entry boundary
-    r"(?P<token>.+?)\s*"  # token (lazy)
+# Scans a whole metric message in one pass: ';' separates sections, a section
+# may start with a "label:" and holds "token cost%|freq%" entries
+LOW_FREQ_SCAN_RE = re.compile(
+    r"(?P<sep>;)"  # section separator
+    r"|(?:^|(?<=;))\s*(?P<label>[^\s:;][^:;]*):"  # section label
+    r"|(?:(?<=^)|(?<=,)|(?<=;)|(?<=:))\s*+"  # entry boundary
+    r"(?P<token>[^;]+?)\s*"  # token (lazy)
     r"(?P<cost>\d+(?:\.\d+)?)%\|"  # cost%
     r"(?P<freq>\d+(?:\.\d+)?)%",  # freq%
-    re.S,
 )
 
+# Leading labels removed by clean_message, in the order they can be stacked
+MESSAGE_PREFIXES = (
+    "Finger loads % (no thumb): ",
+    "Hand loads % (no thumb): ",
+    "Worst: ",
+)
+
+# Number formatting and sub-metric stripping used by clean_message. Percent
+# numbers only look ahead at their ',' so a following sub-metric can still be
+# stripped in the same pass
+BALANCE_NUMBER_RE = re.compile(r"(\d+\.\d+)(?!%\))")
+PERCENT_NUMBER_RE = re.compile(r"(\d+\.\d+)%(?=,)")
+TRIGRAM_STATISTICS_RE = re.compile(
+    r",\s*3-Roll (?:In|Out):\s*[\d.]+%|;\s*Other:\s*[\d.]+%"  # unwanted sub-metrics
+    r"|(\d+\.\d+)%(?=,)"  # percent number
+)
+
+
+def _stat_pattern_re(patterns: list[str]) -> re.Pattern[str]:
+    """Compile "pattern:" alternatives, longest first, into one regex."""
+    alternatives = sorted(patterns, key=len, reverse=True)
+    return re.compile(f"({'|'.join(map(re.escape, alternatives))}):")
+
+
+# Sub-metric labels underlined by format_message_for_markdown, per metric
+MARKDOWN_STAT_PATTERN_RES = {
+    "Bigram Statistics": _stat_pattern_re(BIGRAM_STAT_PATTERNS),
+    "Trigram Statistics": _stat_pattern_re(TRIGRAM_STAT_PATTERNS),
+    # Extracted scissor and roll statistics
+    "Scissors": _stat_pattern_re(SCISSOR_PATTERNS),
+    "2-Rolls": _stat_pattern_re(["Total", "In", "Out", "Center→South"]),
+}
+
+# Every statistic the summary table extracts
+STATISTIC_LABELS = [
+    *SCISSOR_PATTERNS,
+    *ROLL_PATTERNS,
+    "SFB",
+    "Alt",
+    "Redirect",
+    "Weak redirect",
+    "SFS",
+]
+
+# Scans a statistics message for all STATISTIC_LABELS values in one pass
+STATISTICS_RE = re.compile(
+    r"(?:<u>)?("
+    + "|".join(map(re.escape, sorted(STATISTIC_LABELS, key=len, reverse=True)))
+    + r")(?:</u>)?:\s*([\d.]+%)"
+)
+
+# Runs collapsed to a single hyphen by generate_anchor_id
+NON_ALPHANUMERIC_RUN_RE = re.compile(r"[^a-z0-9]+")
+
 METRICS_ORDER = [
     ("Total Cost", "total_cost", "number", 1),
     ("Hands Disbalance", "Hand Disbalance", "message_only", None),
@@ -80,6 +158,11 @@ METRICS_ORDER = [
 
 COLUMN_HEADERS = ["Layout", "Homerow"] + [display for display, *_ in METRICS_ORDER]
 
+# Statistics messages parsed once per row by build_layout_row. The parsed
+# dicts live under STATISTICS_KEY, outside COLUMN_HEADERS, so exports skip them
+STATISTICS_HEADERS = {"Bigram Statistics", "Trigram Statistics"}
+STATISTICS_KEY = "_statistics"
+
 METRICS_DESCRIPTIONS = {
     "Hands Disbalance": "Left and right hand balance",
     "Finger Balance": "Left pinky -> left index and then right index -> right pinky",
@@ -134,6 +217,7 @@ def generate_metrics_description(filtered_headers: list[str]) -> str:
 # =============================================================================
 
 
+@lru_cache(maxsize=16)
 def get_corpus_paths(corpus_name: str) -> tuple[Path, Path, Path]:
     """Get corpus directory and ngrams file paths."""
     script_dir = Path(__file__).parent
@@ -143,20 +227,23 @@ def get_corpus_paths(corpus_name: str) -> tuple[Path, Path, Path]:
     return project_root, corpus_dir, ngrams_file
 
 
+@lru_cache(maxsize=8)
 def load_bigram_frequencies(corpus_name: str) -> dict[str, float]:
-    """Load bigram frequencies from corpus 2-grams.txt file."""
+    """Load bigram frequencies from corpus 2-grams.txt file.
+
+    Results are cached per corpus, so callers must not mutate the returned dict.
+    """
     _, _, ngrams_file = get_corpus_paths(corpus_name)
 
-    frequencies = {}
-    with open(ngrams_file, encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split(" ")
-            if len(parts) >= 2:
-                freq = float(parts[0])
-                bigram = parts[1]
-                if len(bigram) == 2:
-                    frequencies[bigram] = freq
-    return frequencies
+    with open(ngrams_file, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        # Stream lines; only the frequency and bigram fields are split off
+        rows = (line.strip().split(" ", 2) for line in f)
+        # Frequencies are only converted for the rows that are kept
+        return {
+            parts[1]: float(parts[0])
+            for parts in rows
+            if len(parts) >= 2 and len(parts[1]) == 2
+        }
 
 
 def validate_corpus(corpus_name: str) -> str:
@@ -166,19 +253,20 @@ def validate_corpus(corpus_name: str) -> str:
 
     project_root, corpus_dir, _ = get_corpus_paths(corpus_name)
 
-    if not corpus_dir.exists():
-        ngrams_dir = project_root / "ngrams"
-        available_corpora = (
-            sorted([d.name for d in ngrams_dir.iterdir() if d.is_dir()])
-            if ngrams_dir.exists()
-            else []
-        )
-        available = (
-            f" Available: {', '.join(available_corpora)}" if available_corpora else ""
-        )
-        raise typer.BadParameter(f"Corpus '{corpus_name}' not found.{available}")
+    if corpus_dir.is_dir():
+        return corpus_name
 
-    return corpus_name
+    # Only list the alternatives when reporting the error
+    ngrams_dir = project_root / "ngrams"
+    available_corpora = (
+        sorted([d.name for d in ngrams_dir.iterdir() if d.is_dir()])
+        if ngrams_dir.is_dir()
+        else []
+    )
+    available = (
+        f" Available: {', '.join(available_corpora)}" if available_corpora else ""
+    )
+    raise typer.BadParameter(f"Corpus '{corpus_name}' not found.{available}")
 
 
 # =============================================================================
@@ -194,86 +282,66 @@ def drop_low_freq_entries(
     Preserves tokens that include punctuation such as commas (e.g., 'l,', 'o,', 'a.').
     Drops empty sections.
     """
-    out_sections = []
-    for raw_sec in (s.strip() for s in message.split(";")):
-        if not raw_sec:
-            continue
-        m = SECTION_RE.match(raw_sec)
-        if m:
-            label, body = m.group(1).strip(), m.group(2)
-        else:
-            label, body = None, raw_sec
-
-        kept = []
-        for em in ENTRY_RE.finditer(body):
-            token = em.group("token").strip()  # keep punctuation like ',' or '.'
-            cost = em.group("cost")
-            freq = float(em.group("freq"))
-            if freq >= threshold:
-                kept.append(f"{token} {cost}%|{em.group('freq')}%")
-
-        if kept:
-            out_sections.append(
-                f"{label}: {', '.join(kept)}" if label else ", ".join(kept)
-            )
+    out_sections: list[str] = []
+    label, kept = "", []
+    compare_text = threshold == DEFAULT_FREQ_THRESHOLD
+    # findall yields group tuples straight from C; exactly one alternative
+    # matched per tuple, and only its groups are non-empty. The trailing ';'
+    # flushes the last section like any other.
+    for _, section_label, token, cost, freq in LOW_FREQ_SCAN_RE.findall(message + ";"):
+        if freq:
+            if (
+                freq >= DEFAULT_FREQ_THRESHOLD_TEXT
+                if compare_text
+                else float(freq) >= threshold
+            ):
+                # strip() keeps punctuation like ',' or '.'
+                kept.append(f"{token.strip()} {cost}%|{freq}%")
+        elif section_label:
+            label = section_label.strip()
+        else:  # ';' separator
+            if kept:
+                out_sections.append(
+                    f"{label}: {', '.join(kept)}" if label else ", ".join(kept)
+                )
+            label, kept = "", []
 
     return "; ".join(out_sections)
 
 
+def _format_balance_number(match: re.Match[str]) -> str:
+    return f"{float(match[1]):.{BALANCE_METRIC_DECIMALS}f}"
+
+
+def _format_percent_number(match: re.Match[str]) -> str:
+    """Format a percent number, or drop the match if it is not one."""
+    if number := match[1]:
+        return f"{float(number):.{DEFAULT_METRIC_DECIMALS}f}%"
+    return ""
+
+
 def clean_message(message: str, metric_name: str = "") -> str:
     """Clean message for data storage."""
-    prefixes = ["Finger loads % (no thumb): ", "Hand loads % (no thumb): ", "Worst: "]
-    for prefix in prefixes:
+    for prefix in MESSAGE_PREFIXES:
         message = message.removeprefix(prefix)
 
     # Format percentages and other numbers
     match metric_name:
         case "Hand Disbalance" | "Finger Balance":
-            decimals = BALANCE_METRIC_DECIMALS
-            message = re.sub(
-                r"(\d+\.\d+)(?!%\))",
-                lambda m: f"{float(m.group(1)):.{decimals}f}",
-                message,
-            )
+            message = BALANCE_NUMBER_RE.sub(_format_balance_number, message)
         case "Trigram Statistics":
-            # Remove unwanted sub-metrics
-            decimals = DEFAULT_METRIC_DECIMALS
-            message = re.sub(
-                r"(\d+\.\d+)%,",
-                lambda m: f"{float(m.group(1)):.{decimals}f}%,",
-                message,
-            )
-            message = re.sub(r",\s*3-Roll In:\s*[\d.]+%", "", message)
-            message = re.sub(r",\s*3-Roll Out:\s*[\d.]+%", "", message)
-            message = re.sub(r";\s*Other:\s*[\d.]+%", "", message)
+            # Format numbers and remove unwanted sub-metrics
+            message = TRIGRAM_STATISTICS_RE.sub(_format_percent_number, message)
         case _:
-            decimals = DEFAULT_METRIC_DECIMALS
-            message = re.sub(
-                r"(\d+\.\d+)%,",
-                lambda m: f"{float(m.group(1)):.{decimals}f}%,",
-                message,
-            )
+            message = PERCENT_NUMBER_RE.sub(_format_percent_number, message)
 
     return message.strip()
 
 
 def format_message_for_markdown(message: str, metric_name: str = "") -> str:
     """Add markdown formatting tags to message for display."""
-    match metric_name:
-        case "Bigram Statistics":
-            for pattern in BIGRAM_STAT_PATTERNS:
-                message = message.replace(f"{pattern}:", f"<u>{pattern}</u>:")
-        case "Trigram Statistics":
-            for pattern in TRIGRAM_STAT_PATTERNS:
-                message = message.replace(f"{pattern}:", f"<u>{pattern}</u>:")
-        case "Scissors":
-            # Format extracted scissor statistics
-            for pattern in SCISSOR_PATTERNS:
-                message = message.replace(f"{pattern}:", f"<u>{pattern}</u>:")
-        case "2-Rolls":
-            # Format extracted roll statistics
-            for pattern in ["Total", "In", "Out", "Center→South"]:
-                message = message.replace(f"{pattern}:", f"<u>{pattern}</u>:")
+    if pattern_re := MARKDOWN_STAT_PATTERN_RES.get(metric_name):
+        message = pattern_re.sub(r"<u>\1</u>:", message)
 
     return message
 
@@ -288,13 +356,15 @@ def process_layout_metrics(
 ) -> dict[str, dict]:
     """Process all metrics for a single layout result."""
     metrics_data = {}
+    # Low-frequency entries are only dropped when a corpus was given
+    filtered_metrics = METRICS_TO_FILTER if bigram_frequencies else frozenset()
 
     for individual_result in result["details"]["individual_results"]:
         for metric_cost in individual_result["metric_costs"]:
             core = metric_cost["core"]
             message = core["message"]
 
-            if core["name"] in METRICS_TO_FILTER and bigram_frequencies:
+            if core["name"] in filtered_metrics:
                 message = drop_low_freq_entries(message)
 
             metrics_data[core["name"]] = {
@@ -305,35 +375,32 @@ def process_layout_metrics(
     return metrics_data
 
 
-def extract_statistic_value(message: str, pattern: str) -> str:
-    """Extract a specific statistic value from a message string."""
-    # Match pattern like "SFB: 0.26%" or "<u>Alt</u>: 41.2%"
-    # Handle both with and without underline tags
-    escaped_pattern = re.escape(pattern)
-    match = re.search(rf"(?:<u>)?{escaped_pattern}(?:</u>)?:\s*([\d.]+%)", message)
-    return match.group(1) if match else ""
+def parse_statistics(message: str) -> dict[str, str]:
+    """Map each statistic label in a message to its first value."""
+    # Reversed so the first occurrence of a label wins, like re.search
+    return dict(reversed(STATISTICS_RE.findall(message)))
 
 
-def extract_bigram_sfb(message: str) -> str:
+def extract_bigram_sfb(stats: dict[str, str]) -> str:
     """Extract SFB percentage from Bigram Statistics."""
-    return extract_statistic_value(message, "SFB")
+    return stats.get("SFB", "")
 
 
-def extract_bigram_scissors(message: str) -> str:
+def extract_bigram_scissors(stats: dict[str, str]) -> str:
     """Extract all scissor statistics (Vertical, Squeeze, Splay, Diagonal, Lateral)."""
     scissors = []
     for pattern in SCISSOR_PATTERNS:
-        value = extract_statistic_value(message, pattern)
+        value = stats.get(pattern)
         if value:
             scissors.append(f"{pattern}: {value}")
     return ", ".join(scissors) if scissors else ""
 
 
-def extract_trigram_rolls(message: str) -> str:
+def extract_trigram_rolls(stats: dict[str, str]) -> str:
     """Extract all roll statistics into one cell."""
     rolls = []
     for pattern in ROLL_PATTERNS:
-        value = extract_statistic_value(message, pattern)
+        value = stats.get(pattern)
         if value:
             # Shorten labels for compactness
             short_label = pattern.replace("2-Roll ", "")
@@ -341,29 +408,32 @@ def extract_trigram_rolls(message: str) -> str:
     return ", ".join(rolls) if rolls else ""
 
 
-def extract_trigram_alt(message: str) -> str:
+def extract_trigram_alt(stats: dict[str, str]) -> str:
     """Extract Alt percentage from Trigram Statistics."""
-    return extract_statistic_value(message, "Alt")
+    return stats.get("Alt", "")
 
 
-def extract_trigram_redirect(message: str) -> str:
+def extract_trigram_redirect(stats: dict[str, str]) -> str:
     """Extract Redirect percentage from Trigram Statistics."""
-    return extract_statistic_value(message, "Redirect")
+    return stats.get("Redirect", "")
 
 
-def extract_trigram_weak_redirect(message: str) -> str:
+def extract_trigram_weak_redirect(stats: dict[str, str]) -> str:
     """Extract Weak redirect percentage from Trigram Statistics."""
-    return extract_statistic_value(message, "Weak redirect")
+    return stats.get("Weak redirect", "")
 
 
-def extract_trigram_sfs(message: str) -> str:
+def extract_trigram_sfs(stats: dict[str, str]) -> str:
     """Extract SFS percentage from Trigram Statistics."""
-    return extract_statistic_value(message, "SFS")
+    return stats.get("SFS", "")
 
 
 # Summary table configuration: (display_header, source_metric, extractor_function)
-# extractor_function is None for direct access, or a callable for extracted values
-SUMMARY_COLUMNS_CONFIG: list[tuple[str, str, Callable[[str], str] | None]] = [
+# extractor_function is None for direct access, or a callable taking the
+# row's parsed statistics of the source metric for extracted values
+SUMMARY_COLUMNS_CONFIG: list[
+    tuple[str, str, Callable[[dict[str, str]], str] | None]
+] = [
     ("SVG", "SVG", None),
     ("Total Cost", "Total Cost", None),
     ("Hands Disbalance", "Hands Disbalance", None),
@@ -378,6 +448,12 @@ SUMMARY_COLUMNS_CONFIG: list[tuple[str, str, Callable[[str], str] | None]] = [
     ("Layout", "Layout", None),
 ]
 
+# Lookup map from display header to (source_metric, extractor_function)
+SUMMARY_CONFIG_MAP = {
+    header: (source, extractor_fn)
+    for header, source, extractor_fn in SUMMARY_COLUMNS_CONFIG
+}
+
 
 def extract_homerow(layout: str) -> str:
     """Extract center keys (homerow) from layout string.
@@ -390,51 +466,121 @@ def extract_homerow(layout: str) -> str:
     if len(layout) < 40:
         return ""
 
-    centers = [layout[cluster_idx * 5 + 2] for cluster_idx in range(8)]
-    return "".join(centers)
+    # Every 5th char starting at the first center, for the 8 clusters
+    return layout[2:40:5]
+
+
+RowValueHandler = Callable[[float, dict[str, dict]], float | str]
+
+
+def _row_value_handler(
+    display_header: str, metric_name: str, format_type: str, decimals: int | None
+) -> RowValueHandler:
+    """Build the function computing one METRICS_ORDER column from a layout's data."""
+    match format_type:
+        case "number" if display_header == "Total Cost":
+            return lambda total_cost, metrics_data: round(total_cost, decimals)
+        case "number":
+
+            def number_value(
+                total_cost: float, metrics_data: dict[str, dict]
+            ) -> float | str:
+                metric = metrics_data.get(metric_name)
+                return "" if metric is None else round(metric["cost"], decimals)
+
+            return number_value
+        case "message_only" | "worst_only":
+
+            def message_value(total_cost: float, metrics_data: dict[str, dict]) -> str:
+                metric = metrics_data.get(metric_name)
+                if metric is None:
+                    return ""
+                return clean_message(metric["message"], metric_name)
+
+            return message_value
+        case _:
+            return lambda total_cost, metrics_data: ""
+
+
+# (display_header, handler) per METRICS_ORDER column, resolved once at import
+ROW_PLAN: list[tuple[str, RowValueHandler]] = [
+    (display_header, _row_value_handler(display_header, *spec))
+    for display_header, *spec in METRICS_ORDER
+]
 
 
 def build_layout_row(
     layout: str, total_cost: float, metrics_data: dict[str, dict]
 ) -> dict:
-    """Build a dict for one row following COLUMN_HEADERS order."""
+    """Build a dict for one row following COLUMN_HEADERS order.
+
+    Parsed statistics of the STATISTICS_HEADERS columns go under STATISTICS_KEY.
+    """
     row = {}
     row[COLUMN_HEADERS[0]] = layout  # "Layout"
     row[COLUMN_HEADERS[1]] = extract_homerow(layout)  # "Homerow"
 
-    for display_header, metric_name, format_type, decimals in METRICS_ORDER:
-        match format_type:
-            case "number" if display_header == "Total Cost":
-                row[display_header] = round(total_cost, decimals)
-            case "number" if metric_name in metrics_data:
-                cost = metrics_data[metric_name]["cost"]
-                row[display_header] = round(cost, decimals)
-            case "message_only" | "worst_only" if metric_name in metrics_data:
-                message = clean_message(
-                    metrics_data[metric_name]["message"], metric_name
-                )
-                row[display_header] = message
-            case _:
-                row[display_header] = ""
+    for display_header, handler in ROW_PLAN:
+        row[display_header] = handler(total_cost, metrics_data)
+
+    row[STATISTICS_KEY] = {
+        header: parse_statistics(row[header])
+        for header in STATISTICS_HEADERS
+        if row[header]
+    }
     return row
 
 
+# Per-worker bigram frequencies for parse_layouts, set once by the pool initializer
+_worker_bigram_frequencies: dict[str, float] = {}
+
+
+def _init_layout_worker(bigram_frequencies: dict[str, float]) -> None:
+    global _worker_bigram_frequencies
+    _worker_bigram_frequencies = bigram_frequencies
+
+
+def _build_layout_record(
+    result: dict, bigram_frequencies: dict[str, float] | None = None
+) -> dict:
+    """Process one layout result into its row dict."""
+    if bigram_frequencies is None:
+        bigram_frequencies = _worker_bigram_frequencies
+    return build_layout_row(
+        result["details"]["layout"],
+        result["total_cost"],
+        process_layout_metrics(result, bigram_frequencies),
+    )
+
+
 def parse_layouts(json_file: Path, corpus_name: str | None = None) -> list[dict]:
-    """Load results and build a list of dict rows, sorted by total cost."""
+    """Load results and build a list of dict rows, sorted by total cost.
+
+    Large result files are processed on a process pool; layouts are independent.
+    """
 
-    with open(json_file, encoding="utf-8") as f:
-        data = json.load(f)
+    with open(json_file, "rb") as f:
+        content = f.read()
+    data = orjson.loads(content) if orjson else json.loads(content)
 
     bigram_frequencies = load_bigram_frequencies(corpus_name) if corpus_name else {}
-    sorted_data = sorted(data, key=lambda x: x["total_cost"])
+    sorted_data = sorted(data, key=itemgetter("total_cost"))
 
-    records: list[dict] = []
-    for result in sorted_data:
-        layout = result["details"]["layout"]
-        total_cost = result["total_cost"]
-        metrics_data = process_layout_metrics(result, bigram_frequencies)
-        records.append(build_layout_row(layout, total_cost, metrics_data))
-    return records
+    max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(sorted_data) < PARALLEL_LAYOUTS_THRESHOLD:
+        return [
+            _build_layout_record(result, bigram_frequencies) for result in sorted_data
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers,
+        initializer=_init_layout_worker,
+        initargs=(bigram_frequencies,),
+    ) as executor:
+        chunksize = max(1, len(sorted_data) // (max_workers * 4))
+        return list(
+            executor.map(_build_layout_record, sorted_data, chunksize=chunksize)
+        )
 
 
 # =============================================================================
@@ -442,42 +588,82 @@ def parse_layouts(json_file: Path, corpus_name: str | None = None) -> list[dict]
 # =============================================================================
 
 
-def parse_layout_diagram(text: str) -> list[str]:
-    """Parse layout diagram from text and return as list of lines."""
-    lines = text.split("\n")
-    layout_lines = []
+LAYER1_MARKER = "Layout (layer 1):"
+LAYOUT_STRING_MARKER = "Layout string (layer 1):"
 
-    start_idx = next(
-        (i + 1 for i, line in enumerate(lines) if "Layout (layer 1):" in line), None
-    )
-    if start_idx is None:
-        return []
 
-    for line in lines[start_idx:]:
-        if "Layout string" in line:
-            break
-        if line.strip():
-            layout_lines.append(line)
+def iter_layout_diagrams(lines: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    """Yield (layout_string, diagram_lines) for each layout in results.txt lines.
+
+    Single pass state machine: after the layer 1 marker, non-blank lines are
+    collected up to the "Layout string" line; the next non-empty line after
+    the layout string marker is the layout string, which completes the layout.
+    """
+    seek_layer1, in_diagram, seek_string = range(3)
+    state = seek_layer1
+    layout_lines: list[str] = []
+    string_next = False
+
+    for line in lines:
+        line = line.removesuffix("\n")
+
+        if line.startswith(LAYER1_MARKER) or (
+            state == seek_layer1 and LAYER1_MARKER in line
+        ):
+            state, layout_lines, string_next = in_diagram, [], False
+        elif state == in_diagram:
+            if "Layout string" in line:
+                state = seek_string
+                string_next = line.endswith(LAYOUT_STRING_MARKER)
+            elif line.strip():
+                layout_lines.append(line)
+        elif state == seek_string:
+            if string_next and line:
+                if layout_lines:
+                    yield line.strip(), layout_lines
+                state = seek_layer1
+            else:
+                string_next = line.endswith(LAYOUT_STRING_MARKER)
+
+
+class SvgCharStyles(dict):
+    """Rich style for each diagram character, or None to leave it unstyled.
+
+    Empty keys are gray and letters yellow. Each character is classified on
+    first lookup and memoized.
+    """
+
+    def __missing__(self, char: str) -> str | None:
+        style = "yellow" if char.isalpha() else None
+        self[char] = style
+        return style
 
-    return layout_lines
 
+SVG_CHAR_STYLES = SvgCharStyles({"□": "gray"})
 
-def export_svg(layout_lines: list[str], output_path: Path) -> None:
-    """Create SVG representation of the keyboard layout using Rich."""
-    console = Console(record=True, width=64)
 
+def style_diagram_line(line: str) -> str:
+    """Wrap runs of same-styled characters in a single Rich markup tag."""
+    parts = []
+    for style, chars in groupby(line, key=SVG_CHAR_STYLES.__getitem__):
+        run = "".join(chars)
+        parts.append(f"[{style}]{run}[/{style}]" if style else run)
+    return "".join(parts)
+
+
+def print_diagram(console: Console, layout_lines: list[str]) -> None:
+    """Print a styled layout diagram to a Rich console."""
     for line in layout_lines:
-        styled_line = ""
-        for char in line:
-            match char:
-                case "□":
-                    styled_line += f"[gray]{char}[/gray]"
-                case _ if char.isalpha():
-                    styled_line += f"[yellow]{char}[/yellow]"
-                case _:
-                    styled_line += char
-        console.print(styled_line)
+        console.print(style_diagram_line(line))
+
+
+def export_svg(layout_lines: list[str], output_path: Path, echo: bool = True) -> None:
+    """Create SVG representation of the keyboard layout using Rich.
 
+    With echo=False the diagram is only recorded, not printed to the terminal.
+    """
+    console = Console(record=True, width=64, file=None if echo else io.StringIO())
+    print_diagram(console, layout_lines)
     console.save_svg(output_path, title="", font_aspect_ratio=1)
 
 
@@ -489,42 +675,38 @@ def parse_diagrams(txt_file: Path, output_dir: Path) -> list[tuple[str, str]]:
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
 
-    with open(txt_file, encoding="utf-8") as f:
-        content = f.read()
-
-    layout_sections = []
-    current_section = []
-
-    for line in content.split("\n"):
-        if line.startswith("Layout (layer 1):") and current_section:
-            layout_sections.append("\n".join(current_section))
-            current_section = [line]
-        else:
-            current_section.append(line)
-
-    if current_section:
-        layout_sections.append("\n".join(current_section))
+    with open(txt_file, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        diagrams = [
+            (layout_string, layout_lines, output_path / f"{layout_string}.svg")
+            for layout_string, layout_lines in iter_layout_diagrams(f)
+        ]
 
     generated_layouts = []
-
-    for section in layout_sections:
-        if not (
-            layout_string_match := re.search(
-                r"Layout string \(layer 1\):\n(.+)", section
-            )
-        ):
-            continue
-
-        layout_string = layout_string_match.group(1).strip()
-        layout_lines = parse_layout_diagram(section)
-
-        if not layout_lines:
-            continue
-
-        svg_path = output_path / f"{layout_string}.svg"
-        export_svg(layout_lines, svg_path)
-        typer.echo(f"Generated: {svg_path}")
-        generated_layouts.append((layout_string, str(svg_path)))
+    max_workers = os.cpu_count() or 1
+
+    if max_workers == 1 or len(diagrams) < PARALLEL_SVGS_THRESHOLD:
+        for layout_string, layout_lines, svg_path in diagrams:
+            export_svg(layout_lines, svg_path)
+            typer.echo(f"Generated: {svg_path}")
+            generated_layouts.append((layout_string, str(svg_path)))
+        return generated_layouts
+
+    # Rich rendering is CPU bound, so use processes. Workers do not echo the
+    # diagrams, which would interleave on the terminal; the parent prints
+    # them in order instead, as the serial path does
+    terminal = Console(width=64)
+    with ProcessPoolExecutor(max_workers) as executor:
+        chunksize = max(1, len(diagrams) // (max_workers * 4))
+        exports = executor.map(
+            partial(export_svg, echo=False),
+            [layout_lines for _, layout_lines, _ in diagrams],
+            [svg_path for *_, svg_path in diagrams],
+            chunksize=chunksize,
+        )
+        for (layout_string, layout_lines, svg_path), _ in zip(diagrams, exports):
+            print_diagram(terminal, layout_lines)
+            typer.echo(f"Generated: {svg_path}")
+            generated_layouts.append((layout_string, str(svg_path)))
 
     return generated_layouts
 
@@ -534,12 +716,13 @@ def parse_diagrams(txt_file: Path, output_dir: Path) -> list[tuple[str, str]]:
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
 def generate_anchor_id(text: str) -> str:
     """Generate a stable anchor ID (ASCII, lowercase). Non-alphanumerics collapse to hyphens."""
     s = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
     s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)  # any run → hyphen
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    # any run → hyphen; '-' is itself non-alphanumeric, so no double hyphens remain
+    s = NON_ALPHANUMERIC_RUN_RE.sub("-", s).strip("-")
     return s
 
 
@@ -557,17 +740,20 @@ def _md_cell(v: object) -> str:
 
 
 def filter_empty_columns(records: list[dict]) -> list[str]:
-    """Return list of column headers that have non-empty values based on first record."""
+    """Return list of column headers that have a non-empty value in any record."""
     if not records:
         return COLUMN_HEADERS
 
-    first_record = records[0]
-    non_empty_headers = []
-    for header in COLUMN_HEADERS:
-        if str(first_record.get(header, "")).strip() != "":
-            non_empty_headers.append(header)
+    # Only headers still empty so far are checked; stop once all have content
+    empty_headers = list(COLUMN_HEADERS)
+    for rec in records:
+        empty_headers = [
+            header for header in empty_headers if str(rec.get(header, "")).strip() == ""
+        ]
+        if not empty_headers:
+            break
 
-    return non_empty_headers
+    return [header for header in COLUMN_HEADERS if header not in empty_headers]
 
 
 # =============================================================================
@@ -575,16 +761,27 @@ def filter_empty_columns(records: list[dict]) -> list[str]:
 # =============================================================================
 
 
-def export_csv(records: list[dict], output_file: Path) -> None:
-    """Export parsed layout records to CSV file."""
+def export_csv(
+    records: list[dict],
+    output_file: Path,
+    filtered_headers: list[str] | None = None,
+) -> None:
+    """Export parsed layout records to CSV file.
+
+    filtered_headers defaults to filter_empty_columns(records).
+    """
     if not records:
         return
 
-    filtered_headers = filter_empty_columns(records)
+    if filtered_headers is None:
+        filtered_headers = filter_empty_columns(records)
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=filtered_headers, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(records)
+        writer = csv.writer(f)
+        writer.writerow(filtered_headers)
+        # Rows in header order; keys outside filtered_headers are ignored
+        writer.writerows(
+            [rec.get(header, "") for header in filtered_headers] for rec in records
+        )
 
 
 def _generate_layout_anchors(records: list[dict]) -> dict[str, str]:
@@ -638,24 +835,18 @@ def _build_summary_row_cells(
     rec: dict,
     summary_headers: list[str],
     layout_id: dict[str, str],
-    layout_to_svg: dict[str, str],
+    svg_src: dict[str, str],
 ) -> list[str]:
     """Build row cells for summary table based on headers using configuration."""
     row_cells = []
     layout = rec["Layout"]
 
-    # Build lookup map from display header to config
-    config_map = {
-        header: (source, extractor_fn)
-        for header, source, extractor_fn in SUMMARY_COLUMNS_CONFIG
-    }
-
     for header in summary_headers:
         match header:
             case "SVG":
                 svg_cell = (
-                    f'<img src="svgs/{quote(Path(layout_to_svg[layout]).name)}" width="1000">'
-                    if layout in layout_to_svg
+                    f'<img src="{svg_src[layout]}" width="1000">'
+                    if layout in svg_src
                     else ""
                 )
                 row_cells.append(_md_cell(svg_cell))
@@ -664,11 +855,13 @@ def _build_summary_row_cells(
                 row_cells.append(_md_cell(layout_link))
             case _:
                 # Use configuration to determine how to extract the value
-                source_metric, extractor_fn = config_map.get(header, (None, None))
+                source_metric, extractor_fn = SUMMARY_CONFIG_MAP.get(
+                    header, (None, None)
+                )
                 if extractor_fn and source_metric:
                     # Use extractor function to get value from source metric
-                    source_data = rec.get(source_metric, "")
-                    value = extractor_fn(source_data)
+                    stats = rec.get(STATISTICS_KEY, {}).get(source_metric, {})
+                    value = extractor_fn(stats)
                     # Apply markdown formatting for extracted statistics
                     # Use the header name (not source_metric) for formatting context
                     if header in ["Scissors", "2-Rolls"]:
@@ -686,27 +879,24 @@ def _write_summary_table(
     records: list[dict],
     summary_headers: list[str],
     layout_id: dict[str, str],
-    generated_layouts: list[tuple[str, str]],
+    svg_src: dict[str, str],
 ) -> None:
     """Write the summary table section."""
-    f.write("## Summary\n\n")
-
-    # Header row
-    f.write("| " + " | ".join(summary_headers) + " |\n")
-    f.write("|" + "|".join(["--------"] * len(summary_headers)) + "|\n")
-
-    # Map layout -> svg path
-    layout_to_svg = dict(generated_layouts) if generated_layouts else {}
+    parts = [
+        "## Summary\n\n",
+        # Header row
+        "| " + " | ".join(summary_headers) + " |\n",
+        "|" + "|".join(["--------"] * len(summary_headers)) + "|\n",
+    ]
 
     # Data rows
     for rec in records:
-        row_cells = _build_summary_row_cells(
-            rec, summary_headers, layout_id, layout_to_svg
-        )
-        f.write("| " + " | ".join(row_cells) + " |\n")
+        row_cells = _build_summary_row_cells(rec, summary_headers, layout_id, svg_src)
+        parts.append("| " + " | ".join(row_cells) + " |\n")
 
     # Force the table to terminate cleanly in GFM
-    f.write("\n<!-- end of summary table -->\n\n")
+    parts.append("\n<!-- end of summary table -->\n\n")
+    f.writelines(parts)
 
 
 def _write_layout_details(
@@ -714,62 +904,74 @@ def _write_layout_details(
     records: list[dict],
     filtered_headers: list[str],
     layout_id: dict[str, str],
-    generated_layouts: list[tuple[str, str]],
+    svg_src: dict[str, str],
 ) -> None:
     """Write the layout details section with individual layout analysis."""
-    f.write("## Layout Details\n\n")
-
-    layout_to_svg = dict(generated_layouts) if generated_layouts else {}
+    parts = ["## Layout Details\n\n"]
+
+    # Metrics table excludes Total Cost and any "Worst" summaries, which are
+    # listed separately; the split is the same for every record
+    metric_headers = [
+        header
+        for header in filtered_headers[1:]
+        if "Worst" not in header and header != "Total Cost"
+    ]
+    worst_headers = [
+        (header, header.replace(" Worst", ""))
+        for header in filtered_headers[1:]
+        if "Worst" in header
+    ]
 
     for rec in records:
         layout = rec["Layout"]
         anchor = layout_id[layout]
-        f.write(f'<a id="{anchor}"></a>\n')
-        f.write(f"### {layout}\n\n")
+        parts.append(f'<a id="{anchor}"></a>\n')
+        parts.append(f"### {layout}\n\n")
 
         # Add SVG image if available
-        if layout in layout_to_svg:
-            svg_filename = Path(layout_to_svg[layout]).name
-            f.write(f'<img src="svgs/{quote(svg_filename)}" width="800">\n\n')
+        if layout in svg_src:
+            parts.append(f'<img src="{svg_src[layout]}" width="800">\n\n')
 
-        f.write(f"**Total Cost:** {rec.get('Total Cost', '')}\n\n")
+        parts.append(f"**Total Cost:** {rec.get('Total Cost', '')}\n\n")
 
-        # Build metrics table excluding Total Cost and any "Worst" summaries
         metrics_data = [
-            (header, str(rec.get(header, "")))
-            for header in filtered_headers[1:]
-            if "Worst" not in header
-            and header != "Total Cost"
-            and rec.get(header, "") != ""
+            (header, str(value))
+            for header in metric_headers
+            if (value := rec.get(header, "")) != ""
         ]
         if metrics_data:
             metric_names, values = zip(*metrics_data)
-            f.write("| " + " | ".join(metric_names) + " |\n")
-            f.write("|" + "|".join(["--------"] * len(metric_names)) + "|\n")
+            parts.append("| " + " | ".join(metric_names) + " |\n")
+            parts.append("|" + "|".join(["--------"] * len(metric_names)) + "|\n")
             # Format values for markdown and escape all cell contents to avoid breaking the table
             formatted_values = [
                 format_message_for_markdown(v, name)
                 for name, v in zip(metric_names, values)
             ]
-            f.write("| " + " | ".join(_md_cell(v) for v in formatted_values) + " |\n")
+            parts.append(
+                "| " + " | ".join(_md_cell(v) for v in formatted_values) + " |\n"
+            )
 
         worst_cases = [
-            (header.replace(" Worst", ""), rec.get(header, ""))
-            for header in filtered_headers[1:]
-            if "Worst" in header and rec.get(header, "")
+            (metric_name, value)
+            for header, metric_name in worst_headers
+            if (value := rec.get(header, ""))
         ]
         if worst_cases:
             for metric_name, value in worst_cases:
                 formatted_value = format_message_for_markdown(value, metric_name)
-                f.write(f"- **{metric_name}:** {formatted_value}\n")
+                parts.append(f"- **{metric_name}:** {formatted_value}\n")
+
+        parts.append("\n---\n\n")
 
-        f.write("\n---\n\n")
+    f.writelines(parts)
 
 
 def export_markdown(
     records: list[dict],
     generated_layouts: list[tuple[str, str]],
     output_file: Path,
+    filtered_headers: list[str] | None = None,
 ) -> None:
     """Export parsed layout records to markdown with summary table and detailed sections.
 
@@ -778,19 +980,25 @@ def export_markdown(
     - Summary table with key metrics
     - Detailed layout analysis
     - Metrics descriptions
+
+    filtered_headers defaults to filter_empty_columns(records).
     """
-    filtered_headers = filter_empty_columns(records)
+    if filtered_headers is None:
+        filtered_headers = filter_empty_columns(records)
     layout_id = _generate_layout_anchors(records)
     summary_headers = _get_summary_headers(filtered_headers)
+    # Map layout -> relative, URL-quoted svg image source
+    svg_src = {
+        layout: f"svgs/{quote(Path(svg_path).name)}"
+        for layout, svg_path in generated_layouts or ()
+    }
 
     with open(output_file, "w", encoding="utf-8") as f:
         f.write("# Keyboard Layout Results\n\n")
 
         _write_table_of_contents(f, records, layout_id)
-        _write_summary_table(f, records, summary_headers, layout_id, generated_layouts)
-        _write_layout_details(
-            f, records, filtered_headers, layout_id, generated_layouts
-        )
+        _write_summary_table(f, records, summary_headers, layout_id, svg_src)
+        _write_layout_details(f, records, filtered_headers, layout_id, svg_src)
 
         # ---- Metrics Description ----
         all_headers = set(filtered_headers)
@@ -846,10 +1054,12 @@ def main(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     records = parse_layouts(json_file, corpus)
+    # Shared by the CSV and markdown exports
+    filtered_headers = filter_empty_columns(records)
 
     csv_file = output_dir / f"{output_base}.csv"
     typer.echo(f"Generating CSV: {csv_file}")
-    export_csv(records, csv_file)
+    export_csv(records, csv_file, filtered_headers)
 
     if txt_file.exists():
         typer.echo(f"Found {txt_file}, generating SVG files and markdown table...")
@@ -860,7 +1070,7 @@ def main(
 
         markdown_file = output_dir / f"{output_base}.md"
         typer.echo(f"Generating markdown table: {markdown_file}")
-        export_markdown(records, generated_layouts, markdown_file)
+        export_markdown(records, generated_layouts, markdown_file, filtered_headers)
 
 
 if __name__ == "__main__":